@@ -1,12 +1,16 @@
 """Provision script for DID WebVH server with sample data."""
 
 import os
+import re
 import requests
+import threading
 import uuid
-import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from loguru import logger
-
-from operator import itemgetter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 AGENT_ADMIN_API_URL = os.getenv("AGENT_ADMIN_API_URL", "http://witness-agent:8020")
 AGENT_ADMIN_API_HEADERS = {"X-API-KEY": os.getenv("AGENT_ADMIN_API_KEY", "")}
@@ -14,11 +18,58 @@ WATCHER_API_HEADERS = {"X-API-KEY": os.getenv("WATCHER_API_KEY", "")}
 WEBVH_SERVER_URL = os.getenv("WEBVH_SERVER_URL", None)
 WATCHER_URL = os.getenv("WATCHER_URL", None)
 
+# Rate limiting is reactive: a 429 is retried after the server's Retry-After delay.
+# POST is only replayed when it cannot have been processed: on a 429 or a connect
+# failure. read=False keeps a POST that timed out or lost its response from being sent twice.
+_RETRY = Retry(
+    total=3,
+    read=False,
+    backoff_factor=0.2,
+    status_forcelist=[429],
+    allowed_methods=None,
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+_local = threading.local()
+
+
+def get_session():
+    """Return this thread's session, reusing pooled keep-alive connections.
+
+    requests.Session is not guaranteed thread-safe, so each provisioning worker gets its own.
+    """
+    if not hasattr(_local, "session"):
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=_RETRY)
+        _local.session = requests.Session()
+        _local.session.mount("http://", adapter)
+        _local.session.mount("https://", adapter)
+    return _local.session
+
+
+# did:webvh:{scid}:{domain}:{namespace}:{alias}
+_DID_RE = re.compile(r"did:([^:]+):([^:]+):([^:]+)(?::([^:]+):([^:]+))?")
+
+
+@dataclass(frozen=True, slots=True)
+class DidParts:
+    """Components of a did:webvh identifier."""
+
+    method: str
+    scid: str
+    domain: str
+    namespace: str | None
+    alias: str | None
+
+
+@lru_cache(maxsize=1024)
+def parse_did(did):
+    """Split a did:webvh identifier into its components."""
+    match = _DID_RE.match(did)
+    return DidParts(*match.groups())
+
 
 def try_return(request):
-    """Extract JSON from request with rate limiting delay."""
-    # Sleep to avoid rate limiting
-    time.sleep(1)
+    """Extract JSON from request."""
     try:
         return request.json()
     except requests.exceptions.JSONDecodeError:
@@ -30,7 +81,7 @@ def try_return(request):
 def configure_plugin(server_url=WEBVH_SERVER_URL):
     """Configure the DID WebVH plugin on the agent."""
     logger.info("Configuring plugin")
-    r = requests.post(
+    r = get_session().post(
         f"{AGENT_ADMIN_API_URL}/did/webvh/configuration",
         headers=AGENT_ADMIN_API_HEADERS,
         json={
@@ -46,17 +97,17 @@ def configure_plugin(server_url=WEBVH_SERVER_URL):
 
 def register_watcher(did):
     """Register a DID with the watcher service."""
-    scid = itemgetter(2)(did.split(":"))
+    scid = parse_did(did).scid
     logger.info(f"Registering watcher {scid}")
-    r = requests.post(f"{WATCHER_URL}/scid?did={did}", headers=WATCHER_API_HEADERS)
+    r = get_session().post(f"{WATCHER_URL}/scid?did={did}", headers=WATCHER_API_HEADERS)
     return try_return(r)
 
 
 def notify_watcher(did):
     """Notify the watcher service about DID updates."""
-    scid = itemgetter(2)(did.split(":"))
+    scid = parse_did(did).scid
     logger.info(f"Notifying watcher {scid}")
-    r = requests.post(f"{WATCHER_URL}/log?did={did}")
+    r = get_session().post(f"{WATCHER_URL}/log?did={did}")
     return try_return(r)
 
 
@@ -74,7 +125,7 @@ def create_did(namespace):
     if WATCHER_URL:
         options["watchers"] = [WATCHER_URL]
 
-    r = requests.post(
+    r = get_session().post(
         f"{AGENT_ADMIN_API_URL}/did/webvh/create",
         headers=AGENT_ADMIN_API_HEADERS,
         json={"options": options},
@@ -90,7 +141,7 @@ def create_did(namespace):
 def update_did(scid):
     """Update an existing DID by SCID."""
     logger.info(f"Updating DID {scid}")
-    r = requests.post(
+    r = get_session().post(
         f"{AGENT_ADMIN_API_URL}/did/webvh/update?scid={scid}",
         headers=AGENT_ADMIN_API_HEADERS,
         json={},
@@ -101,7 +152,7 @@ def update_did(scid):
 def deactivate_did(scid):
     """Deactivate a DID by SCID."""
     logger.info(f"Deactivating DID {scid}")
-    r = requests.post(
+    r = get_session().post(
         f"{AGENT_ADMIN_API_URL}/did/webvh/deactivate?scid={scid}",
         headers=AGENT_ADMIN_API_HEADERS,
         json={"options": {}},
@@ -111,10 +162,10 @@ def deactivate_did(scid):
 
 def sign_credential(issuer_id, subject_id):
     """Sign a verifiable credential for the subject."""
-    scid = itemgetter(2)(subject_id.split(":"))
+    scid = parse_did(subject_id).scid
     logger.info(f"Signing credential {scid}")
     issuer_key = issuer_id.split(":")[-1]
-    r = requests.post(
+    r = get_session().post(
         f"{AGENT_ADMIN_API_URL}/vc/di/add-proof",
         headers=AGENT_ADMIN_API_HEADERS,
         json={
@@ -144,9 +195,9 @@ def sign_credential(issuer_id, subject_id):
 def sign_presentation(signing_key, credential):
     """Sign a verifiable presentation containing the credential."""
     holder_id = credential.get("credentialSubject").get("id")
-    scid = itemgetter(2)(holder_id.split(":"))
+    scid = parse_did(holder_id).scid
     logger.info(f"Signing presentation {scid}")
-    r = requests.post(
+    r = get_session().post(
         f"{AGENT_ADMIN_API_URL}/vc/di/add-proof",
         headers=AGENT_ADMIN_API_HEADERS,
         json={
@@ -170,9 +221,10 @@ def sign_presentation(signing_key, credential):
 def upload_whois(vp):
     """Upload a WHOIS verifiable presentation to the server."""
     holder_id = vp.get("holder")
-    scid, namespace, alias = itemgetter(2, 4, 5)(holder_id.split(":"))
+    holder = parse_did(holder_id)
+    scid, namespace, alias = holder.scid, holder.namespace, holder.alias
     logger.info(f"Uploading whois {scid}")
-    r = requests.post(
+    r = get_session().post(
         f"{WEBVH_SERVER_URL}/{namespace}/{alias}/whois",
         json={"verifiablePresentation": vp},
     )
@@ -183,9 +235,9 @@ def create_schema(issuer_id, name="Test Schema", version="1.0", attributes=None)
     """Create an AnonCreds schema."""
     if attributes is None:
         attributes = ["test_attribute"]
-    scid = itemgetter(2)(issuer_id.split(":"))
+    scid = parse_did(issuer_id).scid
     logger.info(f"Creating schema {scid}")
-    r = requests.post(
+    r = get_session().post(
         f"{AGENT_ADMIN_API_URL}/anoncreds/schema",
         headers=AGENT_ADMIN_API_HEADERS,
         json={
@@ -203,9 +255,9 @@ def create_schema(issuer_id, name="Test Schema", version="1.0", attributes=None)
 def create_cred_def(schema_id, tag="default", revocation_size=0):
     """Create an AnonCreds credential definition for the schema."""
     issuer_id = schema_id.split("/")[0]
-    scid = itemgetter(2)(issuer_id.split(":"))
+    scid = parse_did(issuer_id).scid
     logger.info(f"Creating cred def {scid}")
-    r = requests.post(
+    r = get_session().post(
         f"{AGENT_ADMIN_API_URL}/anoncreds/credential-definition",
         headers=AGENT_ADMIN_API_HEADERS,
         json={
@@ -240,58 +292,62 @@ witness_id = witnesses[0]
 logger.info(f"Witness Configured: {witness_id}")
 logger.info("Provisioning Server")
 
-# Create DIDs in two namespaces
-for namespace in ["ns-01", "ns-02"]:
-    # Create 2 DIDs in each namespace
-    for idx in range(2):
-        log_entry = create_did(namespace)
-
-        # Validate response structure
-        if not log_entry:
-            logger.error("Failed to create DID - no response from agent")
-            continue
-
-        scid = log_entry.get("parameters", {}).get("scid")
-        did = log_entry.get("state", {}).get("id")
-
-        if not scid or not did:
-            logger.error(f"Invalid DID creation response: {log_entry}")
-            continue
-
-        # Extract signing key
-        state = log_entry.get("state", {})
-        verification_methods = state.get("verificationMethod")
-
-        if not verification_methods or len(verification_methods) == 0:
-            logger.error(f"No verification methods in DID. State: {state}")
-            continue
-
-        signing_key = verification_methods[0].get("publicKeyMultibase")
-        logger.info(f"New signing key: {signing_key}")
-
-        # Register with watcher if configured
-        if WATCHER_URL:
-            register_watcher(did)
-
-        # NOTE, following lines depend on next plugin release
-        # Update the DID twice to generate some log entries
-        update_did(scid)
-        update_did(scid)
-        # notify_watcher(did)
-
-        # Create a sample whois VP
-        vc = sign_credential(witness_id, did).get("securedDocument")
-        vp = sign_presentation(signing_key, vc).get("securedDocument")
-        whois = upload_whois(vp)
-
-        # Create anoncreds schema and cred def
-        schema = create_schema(did)
-        schema_id = schema.get("schema_state", {}).get("schema_id", None)
-        cred_def = create_cred_def(schema_id, revocation_size=10)
-        cred_def_id = cred_def.get("credential_definition_state", {}).get(
-            "credential_definition_id", None
-        )
-
-        # Deactivate every second DID to generate some activity
-        if idx == 1:
-            deactivate_did(scid)
+
+def provision_did(namespace, idx):
+    """Create a DID and generate sample activity for it."""
+    log_entry = create_did(namespace)
+
+    # Validate response structure
+    if not log_entry:
+        logger.error("Failed to create DID - no response from agent")
+        return
+
+    scid = log_entry.get("parameters", {}).get("scid")
+    did = log_entry.get("state", {}).get("id")
+
+    if not scid or not did:
+        logger.error(f"Invalid DID creation response: {log_entry}")
+        return
+
+    # Extract signing key
+    state = log_entry.get("state", {})
+    verification_methods = state.get("verificationMethod")
+
+    if not verification_methods or len(verification_methods) == 0:
+        logger.error(f"No verification methods in DID. State: {state}")
+        return
+
+    signing_key = verification_methods[0].get("publicKeyMultibase")
+    logger.info(f"New signing key: {signing_key}")
+
+    # Register with watcher if configured
+    if WATCHER_URL:
+        register_watcher(did)
+
+    # NOTE, following lines depend on next plugin release
+    # Update the DID twice to generate some log entries
+    update_did(scid)
+    update_did(scid)
+    # notify_watcher(did)
+
+    # Create a sample whois VP
+    vc = sign_credential(witness_id, did).get("securedDocument")
+    vp = sign_presentation(signing_key, vc).get("securedDocument")
+    upload_whois(vp)
+
+    # Create anoncreds schema and cred def
+    schema = create_schema(did)
+    schema_id = schema.get("schema_state", {}).get("schema_id", None)
+    create_cred_def(schema_id, revocation_size=10)
+
+    # Deactivate every second DID to generate some activity
+    if idx == 1:
+        deactivate_did(scid)
+
+
+# Create 2 DIDs in each of two namespaces. Each DID's calls depend only on its
+# own earlier responses, so the DIDs are provisioned concurrently.
+did_jobs = [(namespace, idx) for namespace in ["ns-01", "ns-02"] for idx in range(2)]
+with ThreadPoolExecutor(max_workers=len(did_jobs)) as executor:
+    for future in [executor.submit(provision_did, *job) for job in did_jobs]:
+        future.result()
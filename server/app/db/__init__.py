@@ -24,9 +24,11 @@ from .base import Base
 from .models import (
     DidControllerRecord,
     AttestedResourceRecord,
+    VerifiableCredentialRecord,
     AdminBackgroundTask,
     ServerPolicy,
     KnownWitnessRegistry,
+    WitnessInvitation,
     TailsFile,
 )
 
@@ -34,8 +36,10 @@ __all__ = [
     "Base",
     "DidControllerRecord",
     "AttestedResourceRecord",
+    "VerifiableCredentialRecord",
     "AdminBackgroundTask",
     "ServerPolicy",
     "KnownWitnessRegistry",
+    "WitnessInvitation",
     "TailsFile",
 ]
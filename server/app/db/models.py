@@ -9,23 +9,19 @@ from app.plugins import DidWebVH
 from app.avatar_generator import generate_avatar
 
 
-# Type aliases for cleaner code (defined after classes below)
-# These are forward references, actual assignments are at the end of this file
-
-
 class DidControllerRecord(Base):
     """DID controller with all associated data."""
 
     __tablename__ = "did_controllers"
 
     # Primary key
-    scid = Column(String(255), primary_key=True, index=True)
+    scid = Column(String(255), primary_key=True)
 
     # DID information
     did = Column(String(500), nullable=False, index=True)
-    domain = Column(String(255), nullable=False, index=True)
-    namespace = Column(String(255), nullable=False, index=True)
-    alias = Column(String(255), nullable=False, index=True)
+    domain = Column(String(255), nullable=False)
+    namespace = Column(String(255), nullable=False)
+    alias = Column(String(255), nullable=False)
 
     # Status
     deactivated = Column(Boolean, default=False, index=True, nullable=False)
@@ -56,17 +52,17 @@ class DidControllerRecord(Base):
     resources = relationship(
         "AttestedResourceRecord",
         foreign_keys="AttestedResourceRecord.scid",
-        lazy="selectin",  # Eager load with separate query (efficient for collections)
+        lazy="raise",  # Load explicitly with selectinload() where needed
         order_by="AttestedResourceRecord.created.desc()",
     )
     credentials = relationship(
         "VerifiableCredentialRecord",
         foreign_keys="VerifiableCredentialRecord.scid",
-        lazy="selectin",  # Eager load with separate query
+        lazy="raise",  # Load explicitly with selectinload() where needed
         order_by="VerifiableCredentialRecord.created.desc()",
     )
 
-    # Composite indexes for common query patterns
+    # Composite indexes for common query patterns (also serve lookups on their leading column)
     __table_args__ = (
         Index("idx_controller_namespace_alias", "namespace", "alias"),
         Index("idx_controller_namespace_deactivated", "namespace", "deactivated"),
@@ -130,7 +126,7 @@ class AttestedResourceRecord(Base):
     __tablename__ = "attested_resources"
 
     # Primary key
-    resource_id = Column(String(255), primary_key=True, index=True)
+    resource_id = Column(String(255), primary_key=True)
 
     # Relationships
 
@@ -141,7 +137,7 @@ class AttestedResourceRecord(Base):
     resource_name = Column(String(255), nullable=False)
 
     # DID reference (denormalized for queries)
-    did = Column(String(500), nullable=False, index=True)
+    did = Column(String(500), nullable=False)
 
     # Resource data
     attested_resource = Column(JSON, nullable=False)
@@ -155,7 +151,7 @@ class AttestedResourceRecord(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
-    # Composite indexes for common queries
+    # Composite indexes for common queries (also serve lookups on their leading column)
     __table_args__ = (
         Index("idx_attested_scid_resource_type", "scid", "resource_type"),
         Index("idx_attested_did_resource_type", "did", "resource_type"),
@@ -202,17 +198,17 @@ class VerifiableCredentialRecord(Base):
     __tablename__ = "verifiable_credentials"
 
     # Primary key (credential ID)
-    credential_id = Column(String(500), primary_key=True, index=True)
+    credential_id = Column(String(500), primary_key=True)
 
     # Relationships - FK to DID controller (issuer)
-    scid = Column(String(255), ForeignKey("did_controllers.scid"), nullable=False, index=True)
+    scid = Column(String(255), ForeignKey("did_controllers.scid"), nullable=False)
 
     # DID reference (denormalized for queries)
-    issuer_did = Column(String(500), nullable=False, index=True)
+    issuer_did = Column(String(500), nullable=False)
 
     # Credential information
     credential_type = Column(JSON, nullable=False)  # List of types
-    subject_id = Column(String(500), nullable=True, index=True)  # credentialSubject.id if present
+    subject_id = Column(String(500), nullable=True)  # credentialSubject.id if present
 
     # Credential data (full VC)
     verifiable_credential = Column(JSON, nullable=False)
@@ -234,7 +230,7 @@ class VerifiableCredentialRecord(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
-    # Composite indexes for common queries
+    # Composite indexes for common queries (also serve lookups on their leading column)
     __table_args__ = (
         Index("idx_credential_scid_revoked", "scid", "revoked"),
         Index("idx_credential_issuer_revoked", "issuer_did", "revoked"),
@@ -248,14 +244,14 @@ class AdminBackgroundTask(Base):
     __tablename__ = "admin_background_tasks"
 
     # Primary key
-    task_id = Column(String(36), primary_key=True, index=True)
+    task_id = Column(String(36), primary_key=True)
 
     # Task information
-    task_type = Column(String(50), nullable=False, index=True)
+    task_type = Column(String(50), nullable=False)
     status = Column(String(20), nullable=False, index=True)
 
     # Task data
-    progress = Column(JSON, default={})
+    progress = Column(JSON, default=dict)
     message = Column(Text)
 
     # Timestamps
@@ -264,7 +260,7 @@ class AdminBackgroundTask(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
-    # Composite index
+    # Composite index (also serves lookups on its leading column)
     __table_args__ = (Index("idx_task_type_status", "task_type", "status"),)
 
     def to_dict(self):
@@ -352,7 +348,7 @@ class WitnessInvitation(Base):
 
     __tablename__ = "witness_invitations"
 
-    witness_did = Column(String(255), primary_key=True, index=True)
+    witness_did = Column(String(255), primary_key=True)
     invitation_id = Column(String(255), nullable=True, index=True)
     invitation_url = Column(Text, nullable=False)
     invitation_payload = Column(JSON, nullable=False)
@@ -371,7 +367,7 @@ class TailsFile(Base):
     __tablename__ = "tails_files"
 
     # Primary key - base58 encoded SHA256 hash of file
-    tails_hash = Column(String(100), primary_key=True, index=True)
+    tails_hash = Column(String(100), primary_key=True)
 
     # File content stored as hex string
     file_content_hex = Column(Text, nullable=False)
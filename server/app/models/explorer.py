@@ -106,9 +106,9 @@ class ExplorerDidRecord(CustomBaseModel):
         did_avatar = controller.avatar or generate_avatar(controller.scid)
 
         # Transform resources to summaries (limit to first 5 for display)
-        # controller.resources is batch-loaded via selectin relationship
+        # controller.resources is batch-loaded by StorageManager.get_did_controllers
         formatted_resources = [
-            DidResourceSummary(
+            DidResourceSummary.model_construct(
                 type=r.resource_type,
                 digest=r.resource_id,
                 created=beautify_date(r.created),
@@ -119,9 +119,9 @@ class ExplorerDidRecord(CustomBaseModel):
         ]
 
         # Transform credentials to summaries (limit to first 5 for display)
-        # controller.credentials is batch-loaded via selectin relationship
+        # controller.credentials is batch-loaded by StorageManager.get_did_controllers
         formatted_credentials = [
-            DidCredentialSummary(
+            DidCredentialSummary.model_construct(
                 id=c.credential_id,
                 type=c.credential_type,
                 subject_id=c.subject_id,
@@ -137,7 +137,7 @@ class ExplorerDidRecord(CustomBaseModel):
         ]
 
         # Generate links
-        links = ExplorerDidLinks(
+        links = ExplorerDidLinks.model_construct(
             resolver=f"{settings.UNIRESOLVER_URL}/#{controller.did}",
             log_file=f"https://{controller.domain}/{controller.namespace}/{controller.alias}/did.jsonl",
             witness_file=f"https://{controller.domain}/{controller.namespace}/{controller.alias}/did-witness.json",
@@ -145,7 +145,8 @@ class ExplorerDidRecord(CustomBaseModel):
             whois_presentation=f"https://{controller.domain}/{controller.namespace}/{controller.alias}/whois.vp",
         )
 
-        return cls(
+        # Response-only model built from DB rows; skip validation
+        return cls.model_construct(
             # Basic info
             did=controller.did,
             scid=controller.scid,
@@ -246,7 +247,7 @@ class ExplorerResourceRecord(CustomBaseModel):
             resource_url = f"https://{domain}/{namespace}/{alias}/resources/{resource.resource_id}"
 
         # Create author object
-        author = ResourceAuthor(
+        author = ResourceAuthor.model_construct(
             scid=resource.scid,
             domain=domain,
             namespace=namespace,
@@ -254,7 +255,8 @@ class ExplorerResourceRecord(CustomBaseModel):
             avatar=avatar,
         )
 
-        return cls(
+        # Response-only model built from DB rows; skip validation
+        return cls.model_construct(
             # Basic info
             did=did_from_id,
             scid=resource.scid,
@@ -382,7 +384,8 @@ class ExplorerCredentialRecord(CustomBaseModel):
             credential.issuer_did.split(":")[1] if ":" in credential.issuer_did else "unknown"
         )
 
-        return cls(
+        # Response-only model built from DB rows; skip validation
+        return cls.model_construct(
             # Basic info
             credential_id=credential.credential_id,
             issuer_did=credential.issuer_did,
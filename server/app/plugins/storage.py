@@ -2,10 +2,9 @@
 
 import asyncio
 import logging
-from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session, selectinload, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from config import settings
@@ -66,8 +65,14 @@ class StorageManager:
             )
         elif self.db_type == "postgres":
             # PostgreSQL configuration
+            # Recycle pooled connections before server/proxy idle timeouts drop them
             self._engine = create_engine(
-                self.db_url, pool_pre_ping=True, pool_size=10, max_overflow=20, echo=False
+                self.db_url,
+                pool_pre_ping=True,
+                pool_size=10,
+                max_overflow=20,
+                pool_recycle=1800,
+                echo=False,
             )
         else:
             raise ValueError(f"Invalid database type: {self.db_type}")
@@ -305,9 +310,15 @@ class StorageManager:
     def get_did_controllers(
         self, filters: Optional[Dict[str, Any]] = None, limit: Optional[int] = None, offset: int = 0
     ) -> List[DidControllerRecord]:
-        """Get DID controllers with optional filters and pagination."""
+        """Get DID controllers with optional filters and pagination.
+
+        Resources and credentials are batch-loaded for the whole page.
+        """
         with self.get_session() as session:
-            query = session.query(DidControllerRecord)
+            query = session.query(DidControllerRecord).options(
+                selectinload(DidControllerRecord.resources),
+                selectinload(DidControllerRecord.credentials),
+            )
 
             if filters:
                 query = self._apply_did_controller_filters(query, filters)
@@ -581,7 +592,6 @@ class StorageManager:
                 credential.verifiable_credential = verifiable_credential
                 if verification_method:
                     credential.verification_method = verification_method
-                credential.updated = datetime.now(timezone.utc)
                 credential = self._commit_and_refresh(session, credential)
             return credential
 
@@ -34,12 +34,14 @@ async def new_log_entry(
 ):
     """Create a new log entry for a given namespace and alias."""
 
-    log_entry = request_body.model_dump().get("logEntry")
-    witness_signature = request_body.model_dump().get("witnessSignature")
+    request_data = request_body.model_dump()
+    log_entry = request_data.get("logEntry")
+    witness_signature = request_data.get("witnessSignature")
 
-    # Debug logging
+    # Debug logging (only serialize the entry when debug output is enabled)
     logger.info(f"=== New Log Entry Request: {namespace}/{alias} ===")
-    logger.debug(f"Log Entry: {json.dumps(log_entry, indent=2)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Log Entry: {json.dumps(log_entry, indent=2)}")
     logger.debug(f"Witness Signature: {witness_signature is not None}")
 
     # Get policy and registry from database
@@ -7,16 +7,12 @@ import uuid
 import threading
 import uvicorn
 
-from dotenv import load_dotenv
-
 from app.plugins.storage import StorageManager
 from app.tasks import TaskManager  # set_policies, sync_explorer_records
 
 logger = logging.getLogger(__name__)
 
-basedir = os.path.abspath(os.path.dirname(__file__))
-load_dotenv(os.path.join(basedir, ".env"))
-
+# The .env file is loaded once by config.py, imported through the app modules above.
 APP_PORT = int(os.getenv("APP_PORT", "8000"))
 APP_WORKERS = int(os.getenv("APP_WORKERS", "4"))
 